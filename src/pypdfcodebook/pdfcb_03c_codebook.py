@@ -7,17 +7,111 @@
 ******************************************************************************
 """
 
+import os
 import pandas as pd
 import numpy as np
-import csv
-import random
 from datetime import datetime
-from fpdf import FPDF, TextStyle, XPos, YPos
-from typing import Dict, List, Union, Optional, Any
+from fpdf import TextStyle, XPos, YPos
+from typing import Dict, List, NamedTuple, Union, Optional, Any
 
 from pypdfcodebook.pdfcb_03b_pdffunctions import PDF
 
 
+# Datastructure keys read into each ColumnSpec field
+COLUMN_SPEC_KEYS = {
+    'label': 'label',
+    'data_type': 'DataType',
+    'py_type': 'pyType',
+    'analysis_unit': 'AnalysisUnit',
+    'measure_unit': 'MeasureUnit',
+    'notes': 'notes',
+    'primary_key': 'primary_key',
+    'pop_var': 'pop_var',
+    'categories_dict': 'categories_dict',
+    'categories_dict_v2': 'categories_dict_v2',
+}
+
+# Section heading styles
+# Level 0 titles:
+LEVEL0_TITLE_STYLE = TextStyle(
+    font_family="helvetica",
+    font_style="B",
+    font_size_pt=14,
+    color=(0, 0, 0),
+    underline=True,
+    t_margin=0,
+    l_margin=10,
+    b_margin=0,
+)
+# Level 1 subtitles:
+LEVEL1_TITLE_STYLE = TextStyle(
+    font_family="helvetica",
+    font_style="B",
+    font_size_pt=12,
+    color=(0, 0, 0),
+    underline=True,
+    t_margin=0,
+    l_margin=20,
+    b_margin=5,
+)
+
+
+class ColumnSpec(NamedTuple):
+    """
+    Immutable metadata for one variable, compiled once from the datastructure.
+
+    Variable summaries read these fields as attributes instead of repeating
+    nested dictionary lookups on the datastructure for every table.
+    Fields missing from the datastructure keep their defaults.
+    """
+    label: str = ''
+    data_type: str = ''
+    py_type: Any = ''
+    analysis_unit: str = ''
+    measure_unit: str = ''
+    notes: Optional[str] = None
+    primary_key: Optional[str] = None
+    pop_var: str = ''
+    categories_dict: Optional[Dict[Any, Any]] = None
+    categories_dict_v2: Optional[Dict[Any, Any]] = None
+
+    @classmethod
+    def from_meta(cls, meta: Dict[str, Any]) -> "ColumnSpec":
+        """
+        Build a ColumnSpec from one variable's datastructure dictionary.
+
+        Args:
+            meta (Dict[str, Any]): Metadata dictionary for a single variable.
+
+        Returns:
+            ColumnSpec: The compiled metadata for the variable.
+        """
+        return cls(**{field: meta[key] for field, key in COLUMN_SPEC_KEYS.items() if key in meta})
+
+
+def category_cell_widths(epw: float, ncols: int) -> Union[str, List[float]]:
+    """
+    Column widths for a categorical frequency table.
+
+    The code column is narrow, the count and percent columns have fixed widths
+    and the label column takes the remaining page width.
+
+    Args:
+        epw (float): Effective page width of the PDF.
+        ncols (int): Number of columns in the frequency table.
+
+    Returns:
+        Union[str, List[float]]: Widths for 4, 5 or 6 columns, otherwise 'even'.
+    """
+    if ncols == 6:
+        return [12, epw - (12 + 24 + 24 + 18 + 18), 24, 24, 18, 18]
+    if ncols == 5:
+        return [12, epw - (12 + 24 + 24 + 30), 30, 24, 24]
+    if ncols == 4:
+        return [12, epw - (12 + 24 + 24), 24, 24]
+    return 'even'
+
+
 class codebook():
     """
     Functions to create a pdf codebook for data
@@ -81,6 +175,40 @@ class codebook():
         self.seed = seed
         self.figures = figures
         self.footer_image_path = footer_image_path
+        # Compile metadata for each variable once
+        self.column_specs = {variable: ColumnSpec.from_meta(meta)
+                             for variable, meta in datastructure.items()}
+        # Markdown file contents, read on first use
+        self._text_cache: Dict[str, str] = {}
+
+    def _read_text(self, path: str, description: str) -> str:
+        """
+        Read a latin-1 text file once and cache its contents on the instance.
+
+        Args:
+            path (str): Path to the text file.
+            description (str): Name of the file used in error messages.
+
+        Returns:
+            str: The decoded file contents.
+
+        Raises:
+            FileNotFoundError: If the file path doesn't exist.
+            UnicodeDecodeError: If the file cannot be decoded as latin-1.
+        """
+        if path not in self._text_cache:
+            try:
+                # newline='' keeps line endings as they are in the file
+                with open(path, "r", encoding="latin-1", newline="") as fh:
+                    self._text_cache[path] = fh.read()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"{description} file not found: {path}")
+            except UnicodeDecodeError as e:
+                raise UnicodeDecodeError(
+                    e.encoding, e.object, e.start, e.end,
+                    f"Cannot decode {description.lower()} file as latin-1: {path}"
+                )
+        return self._text_cache[path]
 
     def render_toc(self, pdf: Any, outline: List[Any]) -> None:
         """
@@ -100,6 +228,12 @@ class codebook():
         pdf.set_fill_color(224, 235, 255)  # Light blue
         pdf.set_font("Helvetica", size=12)
         fill = False
+        # Layout metrics that do not change between entries
+        total_width = pdf.epw
+        dot_width = pdf.get_string_width('.')
+        # Padding between title and page number
+        padding = 2 * pdf.get_string_width(' ')
+        line_height = pdf.font_size * 2
         for section in outline:
             indent = " " * section.level * 2
             link = pdf.add_link()
@@ -107,17 +241,13 @@ class codebook():
             section_title = f"{indent}{section.name}"
             page_str = str(section.page_number)
             # Calculate available width for dots
-            total_width = pdf.epw
             title_width = pdf.get_string_width(section_title)
             page_width = pdf.get_string_width(page_str)
-            dot_width = pdf.get_string_width('.')
-            # Padding between title and page number
-            padding = 2 * pdf.get_string_width(' ')
             dots_width = total_width - title_width - page_width - padding
             n_dots = max(2, int(dots_width // dot_width))
             leader = '.' * n_dots
             toc_line = f"{section_title} {leader} {page_str}"
-            pdf.cell(0, pdf.font_size * 2, text=toc_line, border=0, new_x="LMARGIN", new_y="NEXT", link=link)
+            pdf.cell(0, line_height, text=toc_line, border=0, new_x="LMARGIN", new_y="NEXT", link=link)
 
     def add_projectoverview(self, pdf: Any) -> None:
         """
@@ -161,16 +291,7 @@ class codebook():
         pdf.start_section("Project Overview: Summary of Project Details")
         pdf.ln()
 
-        try:
-            with open(self.projectoverview, "rb") as fh:
-                txt = fh.read().decode("latin-1")
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Project overview file not found: {self.projectoverview}")
-        except UnicodeDecodeError as e:
-            raise UnicodeDecodeError(
-                e.encoding, e.object, e.start, e.end,
-                f"Cannot decode project overview file as latin-1: {self.projectoverview}"
-            )
+        txt = self._read_text(self.projectoverview, "Project overview")
 
         pdf.set_font("Times", size=12)
         line_height = pdf.font_size
@@ -205,32 +326,16 @@ class codebook():
             - If a metadata field is missing for a variable, it is filled with a blank string.
             - The output columns are: Variable Name, Data Type, Length, Categorical, Variable Label.
         """
-        table_rows = []
-        # Set up initial table of variables in data file
-        for variable in self.input_df.columns:
-            table_rows.append([variable])
-        # Create base table
-        table = pd.DataFrame(data=table_rows, columns=["variable name"])
-
-        # Add variable details if in data structure
-        for variable in self.input_df.columns:
-            if variable in self.datastructure:
-                for characteristic in ['DataType', 'length', 'categorical', 'label']:
-                    if characteristic in self.datastructure[variable]:
-                        char = self.datastructure[variable][characteristic]
-                        table.loc[table["variable name"] == variable, characteristic] = char
-                    else:
-                        table.loc[table["variable name"] == variable, characteristic] = ' '
-
-        # Rename columns for output
-        table = table.rename(columns={
-            'variable name': 'Variable Name',
-            'DataType': 'Data Type',
-            'length': 'Length',
-            'categorical': 'Categorical',
-            'label': 'Variable Label'
-        })
-
+        # One record per variable in the data file, with blank metadata fields
+        # when the variable or field is not in the data structure
+        characteristics = ['DataType', 'length', 'categorical', 'label']
+        records = [
+            [variable] + [meta.get(characteristic, ' ') for characteristic in characteristics]
+            for variable in self.input_df.columns
+            for meta in (self.datastructure.get(variable, {}),)
+        ]
+        table = pd.DataFrame.from_records(records, columns=[
+            'Variable Name', 'Data Type', 'Length', 'Categorical', 'Variable Label'])
         return table
 
     def add_datadictionary(self, pdf: Any) -> None:
@@ -250,7 +355,7 @@ class codebook():
         Args:
             pdf (Any): The PDF object to add the data dictionary section to.
                 Should be an instance of the PDF class with FPDF2 functionality
-                including start_section(), create_table(), and markdown support.
+                including start_section(), create_table_from_df(), and markdown support.
 
         Returns:
             None: This method modifies the PDF document in-place.
@@ -261,16 +366,11 @@ class codebook():
             - A new page is automatically added after the data dictionary section.
         """
         table = self.create_data_dictionary_table()
-        styled_table = table.copy()
-        styled_table.reset_index(inplace=True)
-        styled_table = styled_table.drop(columns=['index'])
 
-        # Convert DataFrame directly to list of lists for PDF table
-        table_data = [styled_table.columns.tolist()] + styled_table.values.tolist()
         pdf.start_section("Data Dictionary: Summary of Variables")
         pdf.ln()
-        pdf.create_table(
-            table_data=table_data,
+        pdf.create_table_from_df(
+            table,
             title='',
             align_data='L',
             align_header='C',
@@ -322,16 +422,7 @@ class codebook():
         pdf.start_section("Key Terms and Definitions")
         pdf.ln()
 
-        try:
-            with open(self.keyterms, "rb") as fh:
-                txt = fh.read().decode("latin-1")
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Key terms file not found: {self.keyterms}")
-        except UnicodeDecodeError as e:
-            raise UnicodeDecodeError(
-                e.encoding, e.object, e.start, e.end,
-                f"Cannot decode key terms file as latin-1: {self.keyterms}"
-            )
+        txt = self._read_text(self.keyterms, "Key terms")
         
         pdf.set_font("Times", size=12)
         line_height = pdf.font_size
@@ -364,42 +455,30 @@ class codebook():
             - Percentiles reported: 10th, 25th, 50th, 75th, and 90th.
         """
         # Collect key characteristics of variable
-        total_cases = len(self.input_df[variable])
+        column = self.input_df[variable]
+        # One describe() call provides the count, summary statistics and percentiles
+        summary = column.describe(percentiles=[.1, .25, .5, .75, .9])
+        total_cases = len(column)
         total_cases_fmt = "{:,.0f}".format(total_cases)
-        valid_count = self.input_df[variable].describe()['count']
+        valid_count = summary['count']
         valid_count_fmt = "{:,.0f}".format(valid_count)
-        missing_count = self.input_df[variable].isna().sum()
+        missing_count = total_cases - valid_count
         missing_count_fmt = "{:,.0f}".format(missing_count)
 
-        descriptive_stats = {}
-        for descriptive_stat in ['min', 'max', 'mean', '50%', 'std']:
-            descriptive_stats[descriptive_stat] = "{:,.2f}".format(
-                self.input_df[variable].describe()[descriptive_stat])
-
-        # Add percentiles
-        percentiles_values = self.input_df[variable].quantile([.1, .25, .5, .75, .9])
-        descriptive_stats["10%"] = "{:,.2f}".format(percentiles_values[.1])
-        descriptive_stats["25%"] = "{:,.2f}".format(percentiles_values[.25])
-        descriptive_stats["50%"] = "{:,.2f}".format(percentiles_values[.5])
-        descriptive_stats["75%"] = "{:,.2f}".format(percentiles_values[.75])
-        descriptive_stats["90%"] = "{:,.2f}".format(percentiles_values[.9])
+        descriptive_stats = {
+            descriptive_stat: "{:,.2f}".format(summary[descriptive_stat])
+            for descriptive_stat in ['min', 'max', 'mean', 'std', '10%', '25%', '50%', '75%', '90%']}
 
         # Add additional metadata to table
-        characteristics = {}
-        for characteristic in ['DataType', 'AnalysisUnit', 'MeasureUnit']:
-            if characteristic in self.datastructure[variable]:
-                metadata = self.datastructure[variable][characteristic]
-                characteristics[characteristic] = metadata
-            else:
-                characteristics[characteristic] = ''
-
-        table_data = np.array([
-            ['variable type', 'numeric (' + characteristics['DataType'] + ')'],
+        spec = self.column_specs[variable]
+
+        table_data = [
+            ['variable type', 'numeric (' + spec.data_type + ')'],
             ['total cases', total_cases_fmt],
             ['valid cases', valid_count_fmt],
             ['missing cases', missing_count_fmt],
-            ['unit of measure', characteristics['MeasureUnit']],
-            ['unit of analysis', characteristics['AnalysisUnit']],
+            ['unit of measure', spec.measure_unit],
+            ['unit of analysis', spec.analysis_unit],
             ['range', 'minimum value: ' + descriptive_stats['min'] + ' to  maximum value: ' + descriptive_stats['max']],
             ['mean', descriptive_stats['mean']],
             ['median', descriptive_stats['50%']],
@@ -409,7 +488,7 @@ class codebook():
             ['50th percentile', descriptive_stats['50%']],
             ['75th percentile', descriptive_stats['75%']],
             ['90th percentile', descriptive_stats['90%']]
-        ])
+        ]
         table = pd.DataFrame(data=table_data, columns=["Variable characteristic", "Variable details"])
         return table
 
@@ -432,54 +511,54 @@ class codebook():
             - The variable must be present in both the input DataFrame and the datastructure.
             - If a metadata field is missing, it is filled with a blank string.
             - Random examples are selected to reduce disclosure of identifiable data.
-            - Minimum and maximum string lengths are based on the shortest and longest unique values.
+            - Minimum and maximum string lengths are the shortest and longest non-missing values.
         """
-        # Ensure variable is treated as string for processing
-        describe_var = self.input_df[variable].astype(str)
+        column = self.input_df[variable]
 
         # Collect key characteristics of variable
-        total_cases = len(describe_var)
+        total_cases = len(column)
         total_cases_fmt = f"{total_cases:,}"
-        valid_count = describe_var.describe()['count']
-        valid_count_fmt = f"{valid_count:,}"
-        missing_count = describe_var.loc[describe_var.isna()].count()
+        # None and NaN both count as missing
+        missing_count = int(column.isna().sum())
         missing_count_fmt = f"{missing_count:,}"
-        unique_count = describe_var.describe()['unique']
+        valid_count = total_cases - missing_count
+        valid_count_fmt = f"{valid_count:,}"
+        # Distinct values are hashed once and reused for the count, lengths and examples
+        unique_values = column.unique()
+        distinct_values = pd.Series(unique_values).dropna()
+        unique_count = len(distinct_values)
         unique_count_fmt = f"{unique_count:,}"
 
-        string_list = describe_var.astype(str)
-        varid_list = list(string_list.fillna(value="0"))
-        varid_min = min(varid_list)
-        min_var_len = len(varid_min)
-        varid_max = max(varid_list)
-        max_var_len = len(varid_max)
+        # Length range of the non-missing values, measured on the distinct values only
+        value_lengths = distinct_values.astype(str).str.len()
+        min_var_len = int(value_lengths.min()) if len(value_lengths) else 0
+        max_var_len = int(value_lengths.max()) if len(value_lengths) else 0
 
         # Collect random examples of variable
-        random.seed(self.seed)
-        example_list = self.input_df[variable].unique().tolist()
-        if len(example_list) >= 4:
-            examples = random.sample(example_list, 4)
-        else:
+        # Seeded per variable so examples do not depend on the order tables are built
+        # Examples come from the non-missing distinct values so None/NaN are never shown
+        example_values = distinct_values.to_numpy()
+        rng = np.random.default_rng(self.seed)
+        if len(example_values) >= 4:
+            examples = example_values[rng.choice(len(example_values), size=4, replace=False)].tolist()
+        elif len(example_values) > 0:
             # If fewer than 4 unique values, repeat as needed
-            examples = (example_list * 4)[:4]
+            examples = (example_values.tolist() * 4)[:4]
+        else:
+            # Every value is missing
+            examples = [''] * 4
         example1, example2, example3, example4 = examples
 
         # Add additional metadata to table
-        characteristics = {}
-        for characteristic in ['DataType', 'AnalysisUnit', 'MeasureUnit']:
-            if characteristic in self.datastructure[variable]:
-                metadata = self.datastructure[variable][characteristic]
-                characteristics[characteristic] = metadata
-            else:
-                characteristics[characteristic] = ''
-
-        table_data = np.array([
+        spec = self.column_specs[variable]
+
+        table_data = [
             ['variable type', 'string'],
             ['total cases', total_cases_fmt],
             ['valid cases', valid_count_fmt],
             ['missing cases', missing_count_fmt],
-            ['unit of measure', characteristics['MeasureUnit']],
-            ['unit of analysis', characteristics['AnalysisUnit']],
+            ['unit of measure', spec.measure_unit],
+            ['unit of analysis', spec.analysis_unit],
             ['unique values', unique_count_fmt],
             ['minimum length', min_var_len],
             ['maximum length', max_var_len],
@@ -487,7 +566,7 @@ class codebook():
             ['example 2', example2],
             ['example 3', example3],
             ['example 4', example4]
-        ])
+        ]
         table = pd.DataFrame(data=table_data, columns=["Variable characteristic", "Variable details"])
         return table
 
@@ -528,26 +607,51 @@ class codebook():
                 descriptive_stats[descriptive_stat] = 'NA'
 
         # Add additional metadata to table
-        characteristics = {}
-        for characteristic in ['DataType', 'AnalysisUnit', 'MeasureUnit']:
-            if characteristic in self.datastructure[variable]:
-                metadata = self.datastructure[variable][characteristic]
-                characteristics[characteristic] = metadata
-            else:
-                characteristics[characteristic] = ''
-
-        table_data = np.array([
-            ['variable type', f"categorical ({characteristics['DataType']})"],
+        spec = self.column_specs[variable]
+
+        table_data = [
+            ['variable type', f"categorical ({spec.data_type})"],
             ['total cases', total_cases_fmt],
             ['valid cases', valid_count_fmt],
             ['missing cases', missing_count_fmt],
-            ['unit of measure', characteristics['MeasureUnit']],
-            ['unit of analysis', characteristics['AnalysisUnit']],
+            ['unit of measure', spec.measure_unit],
+            ['unit of analysis', spec.analysis_unit],
             ['range', f"minimum value: {descriptive_stats['min']} to  maximum value: {descriptive_stats['max']}"]
-        ])
+        ]
         table = pd.DataFrame(data=table_data, columns=["Variable characteristic", "Variable details"])
         return table
 
+    def category_label_table(self, variable: str) -> Optional[pd.DataFrame]:
+        """
+        Return the table of category codes and labels for a categorical variable.
+
+        The table is built from the variable's 'categories_dict' (or
+        'categories_dict_v2') each time it is requested, so callers can modify
+        the returned table without affecting later frequency tables.
+
+        Args:
+            variable (str): The name of the categorical variable.
+
+        Returns:
+            Optional[pd.DataFrame]: A table with a 'Code' column and label column(s),
+                or None if the datastructure has no categories dictionary for the variable.
+        """
+        spec = self.column_specs[variable]
+        if spec.categories_dict is not None:
+            categories_df = pd.DataFrame.from_dict(spec.categories_dict, orient='index')
+            categories_df.reset_index(inplace = True)
+            # Rename columns
+            categories_df = categories_df.rename(columns={'index':'Code',
+                                        0 : 'Label'})
+        elif spec.categories_dict_v2 is not None:
+            categories_df = pd.DataFrame.from_dict(spec.categories_dict_v2, orient='index')
+            categories_df.reset_index(inplace = True)
+            # Rename columns
+            categories_df = categories_df.rename(columns={'index':'Code'})
+        else:
+            categories_df = None
+        return categories_df
+
     def categorical_countfreq_table(self,
                                     variable,
                                     primary_key: str = 'huid',
@@ -561,94 +665,67 @@ class codebook():
         pop_var = variable to use to summarize population totals
 
         """
-        output_df = self.input_df.copy()
+        # Only the grouped, counted and summed columns are needed
+        columns = list(dict.fromkeys(
+            [variable, primary_key] + ([pop_var] if pop_var != '' else [])))
+        output_df = self.input_df[columns].copy()
         try:
             # Convert variable from categorical to numeric
             output_df[variable] = output_df[variable].astype(float)
-        except:
+        except (ValueError, TypeError):
+            # Codes that are not numeric are grouped as strings
             output_df[variable] = output_df[variable].astype(str)
-        # Drop missing values
-        output_df = output_df.dropna(subset=[variable])
-        try:
+        else:
+            # Drop missing values and group on integer codes
+            output_df = output_df.dropna(subset=[variable])
             output_df[variable] = output_df[variable].astype(int)
-        except:
-            output_df[variable] = output_df[variable].astype(str)
-        count_table = output_df[[primary_key,variable]].groupby(by=variable).count()
-        count_table.reset_index(inplace=True)
-        # Rename columns
-        label_col = self.datastructure[primary_key]['MeasureUnit']
-        count_table = count_table.rename(columns={primary_key:'Count of '+label_col,
-                                    variable : 'Code'})
-
-        # Add percent column
-        count_table['Percent '+label_col] = \
-            count_table['Count of '+label_col]/count_table['Count of '+label_col].sum()
-
-        # Format columns
-        count_table['Count of '+label_col] = \
-            count_table['Count of '+label_col].apply(lambda x: "{:,}".format(x))
-        count_table['Percent '+label_col] = \
-            count_table['Percent '+label_col].apply(lambda x: "{:.2%}".format(x))
+        # Count records (and sum population) per category in one groupby
+        aggregations = {'count': (primary_key, 'count')}
+        if pop_var != '':
+            aggregations['sum'] = (pop_var, 'sum')
+        # The outer merge with the labels below orders the codes, so skip the groupby sort
+        grouped = output_df.groupby(by=variable, sort=False).agg(**aggregations)
+
+        # Count and percent columns, formatted before the merge
+        label_col = self.column_specs[primary_key].measure_unit
+        count_col = 'Count of ' + label_col
+        percent_col = 'Percent ' + label_col
+        counts = grouped['count']
+        freq_table = pd.DataFrame({
+            'Code': grouped.index,
+            count_col: counts.to_numpy(),
+            percent_col: (counts / counts.sum()).to_numpy()})
+        formats = {count_col: "{:,}".format, percent_col: "{:.2%}".format}
+        # Shown for categories with no records
+        zero_values = {count_col: '0', percent_col: '0.00%'}
+
+        # Add population totals
+        if pop_var != '':
+            label_col = self.column_specs[pop_var].measure_unit
+            sum_col = 'Sum of ' + label_col
+            percent_col = 'Percent ' + label_col
+            sums = grouped['sum']
+            freq_table[sum_col] = sums.to_numpy()
+            freq_table[percent_col] = (sums / sums.sum()).to_numpy()
+            formats.update({sum_col: "{:,}".format, percent_col: "{:.2%}".format})
+            zero_values.update({sum_col: '0', percent_col: '0.00%'})
+
+        # Format before merging, so counts and sums keep their own dtype
+        for column, column_format in formats.items():
+            freq_table[column] = freq_table[column].map(column_format)
 
         # Generate table with all labels
-        if 'categories_dict' in self.datastructure[variable].keys():
-            categories_dict = \
-            self.datastructure[variable]['categories_dict']
-            categories_df = pd.DataFrame.from_dict(categories_dict, orient='index')
-            categories_df.reset_index(inplace = True)
-            # Rename columns
-            categories_df = categories_df.rename(columns={'index':'Code',
-                                        0 : 'Label'})
-        elif 'categories_dict_v2' in self.datastructure[variable].keys():
-            categories_dict = \
-            self.datastructure[variable]['categories_dict_v2']
-            categories_df = pd.DataFrame.from_dict(categories_dict, orient='index')
-            categories_df.reset_index(inplace = True)
-            # Rename columns
-            categories_df = categories_df.rename(columns={'index':'Code'})            
-        else:
+        categories_df = self.category_label_table(variable)
+        if categories_df is None:
             # If no categories dictionary exists, create empty dataframe with just codes
-            unique_codes = count_table['Code'].unique()
+            unique_codes = freq_table['Code'].unique()
             categories_df = pd.DataFrame({'Code': unique_codes, 'Label': unique_codes})
 
-        # Merge count and categories tables
-        categorical_table = \
-            categories_df.merge(count_table, on='Code', how='outer')
+        # Merge counts with all labels, so codes missing from either side are kept
+        categorical_table = categories_df.merge(freq_table, on='Code', how='outer')
 
         # Fill in missing values
-        categorical_table['Count of '+label_col] = \
-            categorical_table['Count of '+label_col].fillna(value='0')
-        categorical_table['Percent '+label_col] = \
-            categorical_table['Percent '+label_col].fillna(value='0.00%')
-
-        # Add population totals
-        if pop_var != '':
-            label_col = self.datastructure[pop_var]['MeasureUnit']
-            pop_table = output_df[[pop_var,variable]].groupby(by=variable).sum()
-            pop_table.reset_index(inplace=True)
-            # Rename columns
-            pop_table = pop_table.rename(columns={pop_var:'Sum of '+label_col,
-                                        variable : 'Code'})
-
-            # Add percent column
-            pop_table['Percent '+label_col] = \
-                pop_table['Sum of '+label_col]/pop_table['Sum of '+label_col].sum()
-
-            # Format columns
-            pop_table['Sum of '+label_col] = \
-                pop_table['Sum of '+label_col].apply(lambda x: "{:,}".format(x))
-            pop_table['Percent '+label_col]  = \
-                pop_table['Percent '+label_col] .apply(lambda x: "{:.2%}".format(x))
-
-            # Merge count and categories tables
-            categorical_table = \
-                categorical_table.merge(pop_table, on='Code', how='outer')
-
-            # Fill in missing values
-            categorical_table['Sum of '+label_col] = \
-                categorical_table['Sum of '+label_col].fillna(value='0')
-            categorical_table['Percent '+label_col] = \
-                categorical_table['Percent '+label_col].fillna(value='0.00%')
+        categorical_table = categorical_table.fillna(value=zero_values)
 
         return categorical_table
 
@@ -667,12 +744,12 @@ class codebook():
         - A summary table for each variable
         - Categorical code/frequency tables where applicable
         - Notes for each variable if present
-        - Automatic page break after each variable
+        - Automatic page break before each variable
 
         Args:
             pdf (Any): The PDF object to add the variable summaries to.
                 Should be an instance of the PDF class with FPDF2 functionality
-                including start_section(), create_table(), multi_cell(), etc.
+                including start_section(), create_table_from_df(), multi_cell(), etc.
 
         Returns:
             None: This method modifies the PDF document in-place.
@@ -693,30 +770,28 @@ class codebook():
         )
         pdf.multi_cell(w=pdf.epw, h=pdf.font_size*2, text=text, new_x="LEFT", new_y="NEXT")
         pdf.ln()
-        pdf.add_page()
-        for variable in self.datastructure.keys():
-            #print(variable)
-            dtype = self.datastructure[variable].get('DataType', '')
-            pytype = self.datastructure[variable].get('pyType', '')
-            if dtype == 'String' and pytype != 'category':
-                table = self.string_table(variable)
-            elif dtype == 'String' and pytype == 'category':
-                table = self.categorical_toptable(variable)
-            elif dtype in ['Float', 'Int'] and pytype != 'category':
-                table = self.numeric_table(variable)
-            elif dtype in ['Float', 'Int'] and pytype == 'category':
-                table = self.categorical_toptable(variable)
-            else:
+        # Summary table builder by (DataType, whether pyType is 'category')
+        summary_tables = {
+            ('String', False): self.string_table,
+            ('String', True): self.categorical_toptable,
+            ('Float', False): self.numeric_table,
+            ('Float', True): self.categorical_toptable,
+            ('Int', False): self.numeric_table,
+            ('Int', True): self.categorical_toptable,
+        }
+        # column_specs follows the datastructure's variable order
+        for variable, spec in self.column_specs.items():
+            dtype = spec.data_type
+            pytype = spec.py_type
+            summary_table = summary_tables.get((dtype, pytype == 'category'))
+            if summary_table is None:
                 continue
-            styled_table = table.copy()
-            styled_table.reset_index(inplace=True)
-            styled_table = styled_table.drop(columns=['index'])
-
-            # Convert DataFrame directly to list of lists for PDF table
-            table_data = [styled_table.columns.tolist()] + styled_table.values.tolist()
-            title = f"{variable}: {self.datastructure[variable].get('label', '')}"
-            pdf.create_table(
-                table_data=table_data,
+            table = summary_table(variable)
+            # Each variable starts on a new page, so no blank page follows the last one
+            pdf.add_page()
+            title = f"{variable}: {spec.label}"
+            pdf.create_table_from_df(
+                table,
                 title=title,
                 data_size=10,
                 title_size=12,
@@ -729,34 +804,19 @@ class codebook():
             # Add table of categories for categorical variables
             if pytype == 'category':
                 pdf.ln()
-                pop_var = self.datastructure[variable].get('pop_var', '')
                 table = self.categorical_countfreq_table(
                     variable=variable,
-                    primary_key=self.datastructure[variable]['primary_key'],
-                    pop_var=pop_var
+                    primary_key=spec.primary_key,
+                    pop_var=spec.pop_var
                 )
-                styled_table = table.copy()
-                styled_table.reset_index(inplace=True)
-                styled_table = styled_table.drop(columns=['index'])
 
-                # Convert DataFrame directly to list of lists for PDF table
-                table_data = [styled_table.columns.tolist()] + styled_table.values.tolist()
                 title = (
-                    f"{variable}: {self.datastructure[variable].get('label', '')} - "
+                    f"{variable}: {spec.label} - "
                     "Categorical codes, labels and frequencies"
                 )
-                ncols = len(table_data[0])
-                #print(ncols)
-                if ncols == 6:
-                    cell_widths = [12, pdf.epw - (12 + 24 + 24 + 18 + 18), 24, 24, 18, 18]
-                elif ncols == 5:
-                    cell_widths = [12, pdf.epw - (12 + 24 + 24 + 30), 30, 24, 24]
-                elif ncols == 4:
-                    cell_widths = [12, pdf.epw - (12 + 24 + 24), 24, 24]
-                else:
-                    cell_widths = 'even'
-                pdf.create_table(
-                    table_data=table_data,
+                cell_widths = category_cell_widths(pdf.epw, len(table.columns))
+                pdf.create_table_from_df(
+                    table,
                     title=title,
                     data_size=10,
                     title_size=12,
@@ -766,16 +826,12 @@ class codebook():
                     line_space=1.75
                 )
             # Add notes if present
-            if 'notes' in self.datastructure[variable]:
-                notes = self.datastructure[variable]['notes']
-                                     
+            notes = spec.notes
+            if notes:
                 pdf.cell(w=0, h=10, text=f"Variable Notes: {variable}", border=0, new_x="LMARGIN", new_y="NEXT")
                 pdf.multi_cell(0, 3, text=notes, new_x="RIGHT", new_y="TOP", align='L', max_line_height=pdf.font_size*2)
                 pdf.ln()
 
-            pdf.add_page()
-
-
 
     def create_codebook(self) -> None:
         """
@@ -804,7 +860,7 @@ class codebook():
         print(f"Creating codebook: {header_text}")
 
         # Generate timestamp for footer reproducibility
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = datetime.now().isoformat(sep=" ", timespec="seconds")
 
         pdf = PDF(
             header_text=header_text,
@@ -815,30 +871,7 @@ class codebook():
         pdf.set_margins(left=15, top=10)
         pdf.alias_nb_pages()
         # Set styles for section headings
-        pdf.set_section_title_styles(
-            # Level 0 titles:
-            TextStyle(
-                font_family="helvetica",
-                font_style="B",
-                font_size_pt=14,
-                color=(0, 0, 0),
-                underline=True,
-                t_margin=0,
-                l_margin=10,
-                b_margin=0,
-            ),
-            # Level 1 subtitles:
-            TextStyle(
-                font_family="helvetica",
-                font_style="B",
-                font_size_pt=12,
-                color=(0, 0, 0),
-                underline=True,
-                t_margin=0,
-                l_margin=20,
-                b_margin=5,
-            ),
-        )
+        pdf.set_section_title_styles(LEVEL0_TITLE_STYLE, LEVEL1_TITLE_STYLE)
         pdf.add_page()
 
         # Add Table of Contents
@@ -864,6 +897,6 @@ class codebook():
             self.add_keyterms(pdf)
 
         # Save codebook
-        codebook_filepath = self.outputfolders['top'] + "/" + self.output_filename + '.pdf'
+        codebook_filepath = os.path.join(self.outputfolders['top'], f"{self.output_filename}.pdf")
         print("Saving codebook to", codebook_filepath)
         pdf.output(codebook_filepath)
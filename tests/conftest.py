@@ -0,0 +1,45 @@
+import os
+import importlib.util
+import pandas as pd
+import pytest
+
+'''
+Shared sample inputs, loaded once per test session.
+'''
+
+SAMPLE_DIR = os.path.join(os.path.dirname(__file__), '..', 'sample_data')
+
+
+SAMPLE_FILES = {
+    'projectoverview': 'pdfcb_00a_projectoverview.md',
+    'keyterms':        'pdfcb_00b_keyterms.md',
+    'csv':             'pdfcb_00c_sampledata.csv',
+    'datastructure':   'pdfcb_00d_data_structure.py',
+    'footer_image':    'IN-CORE_HRRC_Banner.png',
+    'figure':          'pdfcb_00e_sampleimage.jpg',
+}
+
+
+@pytest.fixture(scope="session")
+def sample_paths():
+    # Paths to sample files from a single directory scan, "" if a file is missing
+    available = {entry.name: entry.path for entry in os.scandir(SAMPLE_DIR)}
+    return {key: available.get(name, "") for key, name in SAMPLE_FILES.items()}
+
+
+@pytest.fixture(scope="session")
+def input_df(sample_paths):
+    # Load CSV
+    return pd.read_csv(sample_paths['csv'])
+
+
+@pytest.fixture(scope="session")
+def datastructure(sample_paths):
+    # Load data structure dict from .py file
+    datastructure_path = sample_paths['datastructure']
+    spec = importlib.util.spec_from_file_location("pdfcb_00d_data_structure", datastructure_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load module from {datastructure_path}")
+    ds_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(ds_module)
+    return ds_module.DATA_STRUCTURE
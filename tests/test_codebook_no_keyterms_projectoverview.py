@@ -6,7 +6,7 @@ import os
 Test making a codebook without keyterms or projectoverview files.
 '''
 
-def test_codebook_no_keyterms_projectoverview():
+def test_codebook_no_keyterms_projectoverview(tmp_path):
     # Sample data
     data = {
         'id': [1, 2, 3, 4],
@@ -54,8 +54,7 @@ def test_codebook_no_keyterms_projectoverview():
     }
 
     # Output folder
-    output_folder = os.path.abspath("./tests/output")
-    os.makedirs(output_folder, exist_ok=True)
+    output_folder = str(tmp_path)
 
     # Create codebook instance with no keyterms or projectoverview
     cb = codebook(
@@ -71,4 +70,5 @@ def test_codebook_no_keyterms_projectoverview():
     print("Codebook PDF generated at:", os.path.join(output_folder, "test_codebook_v2.pdf"))
 
 if __name__ == "__main__":
-    test_codebook_no_keyterms_projectoverview()
+    import tempfile
+    test_codebook_no_keyterms_projectoverview(tempfile.mkdtemp())
@@ -1,32 +1,15 @@
 import os
-import pandas as pd
-import importlib.util
 from src.pypdfcodebook.pdfcb_03c_codebook import codebook
 
-def test_codebook_with_sample_data(tmp_path):
+def test_codebook_with_sample_data(tmp_path, sample_paths, input_df, datastructure):
     # Paths to sample files
-    sample_dir = os.path.join(os.path.dirname(__file__), '..', 'sample_data')
-    projectoverview_path = os.path.join(sample_dir, 'pdfcb_00a_projectoverview.md')
-    keyterms_path = os.path.join(sample_dir,        'pdfcb_00b_keyterms.md')
-    csv_path = os.path.join(sample_dir,             'pdfcb_00c_sampledata.csv')
-    datastructure_path = os.path.join(sample_dir,   'pdfcb_00d_data_structure.py')
+    projectoverview_path = sample_paths['projectoverview']
+    keyterms_path = sample_paths['keyterms']
 
-    # Load CSV
-    input_df = pd.read_csv(csv_path)
-
-    # Load data structure dict from .py file
-    spec = importlib.util.spec_from_file_location("pdfcb_00d_data_structure", datastructure_path)
-    if spec is None or spec.loader is None:
-        raise ImportError(f"Could not load module from {datastructure_path}")
-    ds_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(ds_module)
-    datastructure = ds_module.DATA_STRUCTURE
-
-    # Set up output in tests directory
-    tests_dir = os.path.dirname(__file__)
-    output_filename_path = os.path.join(tests_dir, "test_codebook.pdf")
+    # Set up output in a temporary directory
+    output_filename_path = os.path.join(tmp_path, "test_codebook.pdf")
     output_filename = "test_codebook"  # Just the name without extension
-    outputfolders = {'top': tests_dir}
+    outputfolders = {'top': str(tmp_path)}
 
 
     # Create codebook
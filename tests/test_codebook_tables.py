@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+from src.pypdfcodebook.pdfcb_03c_codebook import codebook
+
+'''
+Test the variable summary tables built by the codebook class.
+'''
+
+DATASTRUCTURE = {
+    'name': {
+        'label': 'Name',
+        'DataType': 'String',
+        'AnalysisUnit': 'Person',
+        'MeasureUnit': 'Names',
+    },
+}
+
+
+def string_table_details(tmp_path, values):
+    input_df = pd.DataFrame({'name': values})
+    pdfcodebook = codebook(
+        input_df=input_df,
+        header_title='Test',
+        datastructure=DATASTRUCTURE,
+        projectoverview='',
+        keyterms='',
+        output_filename='test_codebook',
+        outputfolders={'top': str(tmp_path)}
+    )
+    table = pdfcodebook.string_table('name')
+    return dict(zip(table['Variable characteristic'], table['Variable details']))
+
+
+def test_string_table_counts_with_missing_values(tmp_path):
+    details = string_table_details(tmp_path, ['b', 'aaaa', None, 'cc', 'b', np.nan])
+
+    assert details['total cases'] == '6'
+    assert details['valid cases'] == '4'
+    assert details['missing cases'] == '2'
+    assert details['unique values'] == '3'
+
+
+def test_string_table_lengths_ignore_missing_values(tmp_path):
+    details = string_table_details(tmp_path, ['b', 'aaaa', None, 'cc', 'b', np.nan])
+
+    assert details['minimum length'] == 1
+    assert details['maximum length'] == 4
+
+
+def test_string_table_lengths_of_two_values(tmp_path):
+    details = string_table_details(tmp_path, ['b', 'aaaa'])
+
+    assert details['minimum length'] == 1
+    assert details['maximum length'] == 4
+
+
+def test_string_table_examples_skip_missing_values(tmp_path):
+    details = string_table_details(tmp_path, ['b', 'aaaa', None, 'cc', 'b', np.nan])
+
+    examples = [details[f'example {i}'] for i in range(1, 5)]
+    assert not any(pd.isna(example) for example in examples)
+    assert set(examples) == {'b', 'aaaa', 'cc'}
+
+
+def test_string_table_examples_pick_from_distinct_values(tmp_path):
+    values = ['a', 'bb', None, 'ccc', np.nan, 'dddd', 'eeeee', None]
+    details = string_table_details(tmp_path, values)
+
+    examples = [details[f'example {i}'] for i in range(1, 5)]
+    assert len(set(examples)) == 4
+    assert set(examples) <= {'a', 'bb', 'ccc', 'dddd', 'eeeee'}
+
+
+COUNTFREQ_DATASTRUCTURE = {
+    'huid': {'DataType': 'String', 'AnalysisUnit': 'Housing unit', 'MeasureUnit': 'Housing units'},
+    'tenure': {
+        'DataType': 'Integer',
+        'AnalysisUnit': 'Housing unit',
+        'MeasureUnit': 'Tenure',
+        # 4 has no records and 3 is observed but has no label
+        'categories_dict': {1: 'Owner', 2: 'Renter', 4: 'Vacant'},
+    },
+    'people': {'DataType': 'Integer', 'AnalysisUnit': 'Housing unit', 'MeasureUnit': 'People'},
+    'area': {'DataType': 'Float', 'AnalysisUnit': 'Housing unit', 'MeasureUnit': 'Square feet'},
+}
+
+
+def countfreq_rows(tmp_path, pop_var):
+    input_df = pd.DataFrame({
+        'huid': ['a', 'b', 'c', 'd'],
+        'tenure': [1, 1, 2, 3],
+        'people': [2, 3, 1, 4],
+        'area': [1000.5, 800.0, 650.25, 1200.0],
+    })
+    pdfcodebook = codebook(
+        input_df=input_df,
+        header_title='Test',
+        datastructure=COUNTFREQ_DATASTRUCTURE,
+        projectoverview='',
+        keyterms='',
+        output_filename='test_codebook',
+        outputfolders={'top': str(tmp_path)}
+    )
+    table = pdfcodebook.categorical_countfreq_table('tenure', pop_var=pop_var)
+    return {row['Code']: row for row in table.to_dict(orient='records')}
+
+
+def test_countfreq_table_with_int_pop_var(tmp_path):
+    rows = countfreq_rows(tmp_path, 'people')
+
+    assert list(rows) == [1, 2, 3, 4]
+    assert rows[1]['Label'] == 'Owner'
+    assert rows[1]['Count of Housing units'] == '2'
+    assert rows[1]['Percent Housing units'] == '50.00%'
+    assert rows[1]['Sum of People'] == '5'
+    assert rows[1]['Percent People'] == '50.00%'
+    # Observed code missing from the categories dictionary
+    assert pd.isna(rows[3]['Label'])
+    assert rows[3]['Count of Housing units'] == '1'
+    assert rows[3]['Sum of People'] == '4'
+    # Category with no records
+    assert rows[4]['Label'] == 'Vacant'
+    assert rows[4]['Count of Housing units'] == '0'
+    assert rows[4]['Percent Housing units'] == '0.00%'
+    assert rows[4]['Sum of People'] == '0'
+    assert rows[4]['Percent People'] == '0.00%'
+
+
+def test_countfreq_table_with_float_pop_var(tmp_path):
+    rows = countfreq_rows(tmp_path, 'area')
+
+    assert rows[1]['Sum of Square feet'] == '1,800.5'
+    assert rows[3]['Sum of Square feet'] == '1,200.0'
+    assert rows[3]['Percent Square feet'] == '32.87%'
+    # Category with no records
+    assert rows[4]['Count of Housing units'] == '0'
+    assert rows[4]['Sum of Square feet'] == '0'
+    assert rows[4]['Percent Square feet'] == '0.00%'
@@ -1,62 +1,36 @@
 import os
-import pandas as pd
-import importlib.util
 from src.pypdfcodebook.pdfcb_03c_codebook import codebook
 from src.pypdfcodebook.pdfcb_03b_pdffunctions import PDF
 
+# Image formats that can be embedded in the PDF
+SUPPORTED_IMAGE_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tif', '.tiff'})
 
-def test_codebook_with_images(tmp_path):
-    # Paths to sample files
-    sample_dir = os.path.join(os.path.dirname(__file__), '..', 'sample_data')
-    projectoverview_path = os.path.join(sample_dir, 'pdfcb_00a_projectoverview.md')
-    keyterms_path = os.path.join(sample_dir,        'pdfcb_00b_keyterms.md')
-    csv_path = os.path.join(sample_dir,             'pdfcb_00c_sampledata.csv')
-    datastructure_path = os.path.join(sample_dir,   'pdfcb_00d_data_structure.py')
-    footer_image_path = os.path.join(sample_dir, 'IN-CORE_HRRC_Banner.png')
-    figure_path = os.path.join(sample_dir, 'pdfcb_00e_sampleimage.jpg')
 
-    # Check if paths exist, else set to empty string
-    projectoverview_path = projectoverview_path if os.path.exists(projectoverview_path) else ""
-    keyterms_path = keyterms_path if os.path.exists(keyterms_path) else ""
-    csv_path = csv_path if os.path.exists(csv_path) else ""
-    datastructure_path = datastructure_path if os.path.exists(datastructure_path) else ""
-    footer_image_path = footer_image_path if os.path.exists(footer_image_path) else ""
-    figure_path = figure_path if os.path.exists(figure_path) else None
+def supported_image(image_path):
+    # Return the path if the image format is supported, else empty string
+    if not image_path:
+        return ""
+    if os.path.splitext(image_path)[1].lower() not in SUPPORTED_IMAGE_EXTS:
+        print(f"Skipping unsupported image format: {image_path}")
+        return ""
+    return image_path
 
-    # Load CSV
-    input_df = pd.read_csv(csv_path)
 
-    # Load data structure dict from .py file
-    spec = importlib.util.spec_from_file_location("pdfcb_00d_data_structure", datastructure_path)
-    if spec is None or spec.loader is None:
-        raise ImportError(f"Could not load module from {datastructure_path}")
-    ds_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(ds_module)
-    datastructure = ds_module.DATA_STRUCTURE
+def test_codebook_with_images(tmp_path, sample_paths, input_df, datastructure):
+    # Paths to sample files, empty string if missing
+    projectoverview_path = sample_paths['projectoverview']
+    keyterms_path = sample_paths['keyterms']
+    footer_image_path = sample_paths['footer_image']
+    figure_path = sample_paths['figure'] or None
 
-    # Set up output in tests directory
-    tests_dir = os.path.dirname(__file__)
-    output_filename_path = os.path.join(tests_dir, "test_codebook_with_images.pdf")
+    # Set up output in a temporary directory
+    output_filename_path = os.path.join(tmp_path, "test_codebook_with_images.pdf")
     output_filename = "test_codebook_with_images"
-    outputfolders = {'top': tests_dir}
+    outputfolders = {'top': str(tmp_path)}
 
     # Check image formats before PDF creation
-    supported_exts = {'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tif', '.tiff'}
-    if footer_image_path != "":
-        footer_ext = os.path.splitext(footer_image_path)[1].lower()
-        print(f"Footer image extension: {footer_ext}")
-        footer_impage_path_to_use = footer_image_path if footer_ext in supported_exts else ""
-        if footer_image_path == "":
-            print(f"Skipping unsupported footer image format: {footer_image_path}")
-    else:
-        footer_impage_path_to_use = ""
-    if figure_path is not None:
-        figure_ext = os.path.splitext(figure_path)[1].lower()
-        figure_to_use = figure_path if figure_ext in supported_exts else None
-        if figure_to_use is None:
-            print(f"Skipping unsupported figure image format: {figure_path}")
-    else:
-        figure_to_use = None
+    footer_impage_path_to_use = supported_image(footer_image_path)
+    figure_to_use = supported_image(figure_path) or None
 
     print(f"\nUsing footer image: {footer_impage_path_to_use} \n")
 
@@ -0,0 +1,56 @@
+import pytest
+import re
+from src.pypdfcodebook.pdfcb_03b_pdffunctions import PDF
+
+'''
+Test table layout functions in the PDF class.
+'''
+
+def test_uneven_col_widths_use_widest_string():
+    pdf = PDF()
+    pdf.add_page()
+    pdf.set_font("helvetica", size=10)
+    # Helvetica is proportional: fewer but wider characters can be the widest cell
+    table_data = [['header']] + [['iiiiiiii']] * 3 + [['WWWWWWW']]
+
+    col_widths = pdf.get_col_widths(cell_width='uneven',
+                                    data=table_data[1:],
+                                    table_data=table_data)
+
+    widest = max(pdf.get_string_width(row[0]) for row in table_data)
+    assert widest == pdf.get_string_width('WWWWWWW')
+    assert col_widths == [widest + 4]
+
+
+def test_wrapped_table_rows_flow_across_pages_once_in_order():
+    pdf = PDF()
+    # Uncompressed content streams keep the cell text readable in the output
+    pdf.compress = False
+    pdf.add_page()
+    # Long values wrap onto several lines, so each row is taller than one line
+    rows = [[f"row {i:03d}", "long text " * 25] for i in range(60)]
+
+    pdf.create_table(table_data=[["Key", "Value"]] + rows, cell_width=[30, 150])
+    output = bytes(pdf.output())
+
+    assert pdf.pages_count > 1
+    # Content streams are written in page order, so every row marker must
+    # appear exactly once and in the order the rows were given
+    markers = re.findall(rb"row \d{3}", output)
+    assert markers == [row[0].encode() for row in rows]
+
+
+def test_string_width_cache_is_keyed_on_font():
+    pdf = PDF()
+    pdf.add_page()
+    pdf.set_font("helvetica", size=10)
+    small = pdf.get_string_width('hello')
+    pdf.set_font("helvetica", size=30)
+    large = pdf.get_string_width('hello')
+    pdf.set_font("helvetica", "B", 30)
+    bold = pdf.get_string_width('hello')
+
+    assert large == pytest.approx(small * 3)
+    assert bold > large
+    pdf.set_font("helvetica", size=10)
+    assert pdf.get_string_width('hello') == small